@@ -1,3 +1,5 @@
+import sys
+
 from src.main import search_organizations
 
 # С оквэдами
@@ -6,23 +8,27 @@ results = search_organizations(
     okved_filters=['86.23', '86.22', '86.21', '86.90', '32.50', '47.74.1', '47.74.2']
 )
 
-# Display results
+# Display results (collected first and written with a single call)
+lines = []
 for result in results:
-    print(f"\nQuery: {result['query']}")
+    lines.append(f"\nQuery: {result['query']}")
     org = result['organization']
     if org['inn']:
-        print(f"Organization: {org['name']}")
-        print(f"  INN: {org['inn']}")
-        print(f"  OGRN: {org['ogrn']}")
-        print(f"  KPP: {org['kpp']}")
-        print(f"  OKVED: {org['okved']}")
-        print(f"  OKVED Additional: {org['okved_additional']}")
-        print(f"  Address: {org['address']}")
-        print(f"  Phone: {org['phone']}")
-        print(f"  Email: {org['email']}")
-        print(f"  Director: {org['director']}")
-        print(f"  Registration Date: {org['registration_date']}")
-        print(f"  Status: {org['status']}")
-        print(f"  Region: {org['region']}")
+        lines.append(f"Organization: {org['name']}")
+        lines.append(f"  INN: {org['inn']}")
+        lines.append(f"  OGRN: {org['ogrn']}")
+        lines.append(f"  KPP: {org['kpp']}")
+        lines.append(f"  OKVED: {org['okved']}")
+        lines.append(f"  OKVED Additional: {org['okved_additional']}")
+        lines.append(f"  Address: {org['address']}")
+        lines.append(f"  Phone: {org['phone']}")
+        lines.append(f"  Email: {org['email']}")
+        lines.append(f"  Director: {org['director']}")
+        lines.append(f"  Registration Date: {org['registration_date']}")
+        lines.append(f"  Status: {org['status']}")
+        lines.append(f"  Region: {org['region']}")
     else:
-        print("  Organization not found")
+        lines.append("  Organization not found")
+
+sys.stdout.write("\n".join(lines) + "\n")
+sys.stdout.flush()
\ No newline at end of file
@@ -1,6 +1,8 @@
-from .cache_implementations import FileCacheStrategy, NoCacheStrategy
+from .cache_implementations import FileCacheStrategy, NoCacheStrategy, FileResponseCache, shared_file_cache
 
 __all__ = [
     'FileCacheStrategy',
-    'NoCacheStrategy'
+    'NoCacheStrategy',
+    'FileResponseCache',
+    'shared_file_cache'
 ]
\ No newline at end of file
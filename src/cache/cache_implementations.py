@@ -1,75 +1,233 @@
-import json
+import functools
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import logging
 
+import orjson
+
 from ..interfaces import CacheStrategy
 from ..models import Organization
 
 logger = logging.getLogger(__name__)
 
 
+class _SafeFilenameTable(dict):
+    """str.translate table keeping alphanumerics, spaces, dashes and underscores"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Decide each character once, then translate() finds it with a plain lookup
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME = _SafeFilenameTable()
+
+# Name of a cache file written by FileCacheStrategy.set (blake2b digest of the query)
+_HASHED_NAME_RE = re.compile(r'[0-9a-f]{32}\.json')
+
+
 class FileCacheStrategy(CacheStrategy):
     """File-based cache implementation"""
     
-    def __init__(self, cache_dir: str = "cache", cache_days: int = 7):
+    def __init__(self, cache_dir: str = "cache", cache_days: int = 7, memory_size: int = 1024):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_days = cache_days
+        # Files named before the hashing scheme, listed once so misses don't probe disk for them
+        self._legacy_names = frozenset(
+            path.name for path in self.cache_dir.glob('*.json') if not _HASHED_NAME_RE.fullmatch(path.name)
+        )
+        # In-process LRU in front of the files: key -> (monotonic expiry time, organization)
+        self._memory: 'OrderedDict[str, Tuple[float, Organization]]' = OrderedDict()
+        self._memory_size = memory_size
+        self._memory_lock = threading.Lock()
+    
+    def _get_from_memory(self, key: str) -> Optional[Organization]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, organization = entry
+            if time.monotonic() >= expires_at:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return organization
+    
+    def _remember(self, key: str, organization: Organization, ttl_seconds: float) -> None:
+        with self._memory_lock:
+            self._memory[key] = (time.monotonic() + ttl_seconds, organization)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
     
     def _get_cache_path(self, key: str) -> Path:
-        """Generate safe cache file path from key"""
-        safe_filename = "".join(c for c in key if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        """Generate cache file path from a hash of the key"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def _get_legacy_cache_path(self, key: str) -> Path:
+        """Path used before cache files were named by hash"""
+        safe_filename = key.translate(_SAFE_FILENAME).rstrip()
         return self.cache_dir / f"{safe_filename}.json"
     
     def get(self, key: str) -> Optional[Organization]:
         """Retrieve organization from cache if valid"""
-        cache_path = self._get_cache_path(key)
-        if not cache_path.exists():
-            return None
+        organization = self._get_from_memory(key)
+        if organization is not None:
+            return organization
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            try:
+                raw = self._get_cache_path(key).read_bytes()
+            except FileNotFoundError:
+                # Fall back to entries written under the old sanitized-name scheme
+                legacy_path = self._get_legacy_cache_path(key)
+                if legacy_path.name not in self._legacy_names:
+                    return None
+                try:
+                    raw = legacy_path.read_bytes()
+                except FileNotFoundError:
+                    return None
+            
+            data = orjson.loads(raw)
+            
             # Check cache validity
-            cache_time = datetime.fromisoformat(data['cached_at'])
-            if (datetime.now() - cache_time).days >= self.cache_days:
+            cached_at = data['cached_at']
+            if isinstance(cached_at, str):
+                # Entries written before timestamps were stored as unix time
+                cached_at = datetime.fromisoformat(cached_at).timestamp()
+            ttl_seconds = self.cache_days * 86400 - (time.time() - cached_at)
+            if ttl_seconds <= 0:
                 return None
             
-            return Organization(**data['organization'])
+            # Files are written by set() from a validated model, so skip re-validation;
+            # only the date needs converting back from its JSON string
+            fields = data['organization']
+            if fields.get('registration_date'):
+                fields['registration_date'] = datetime.fromisoformat(fields['registration_date'])
+            organization = Organization.model_construct(**fields)
+            self._remember(key, organization, ttl_seconds)
+            return organization
         except Exception as e:
             logger.error(f"Error reading cache for {key}: {str(e)}")
             return None
     
+    async def aget(self, key: str) -> Optional[Organization]:
+        """Serve in-memory hits on the event loop, going to a thread only for disk reads"""
+        organization = self._get_from_memory(key)
+        if organization is not None:
+            return organization
+        return await super().aget(key)
+    
     def set(self, key: str, organization: Organization) -> None:
         """Store organization in cache"""
         cache_path = self._get_cache_path(key)
         try:
-            cache_data = {
-                'cached_at': datetime.now().isoformat(),
-                'query': key,
-                'organization': json.loads(organization.json())  # Use Pydantic's JSON serialization
-            }
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            # Splice pydantic's own JSON into the envelope instead of dumping a dict copy
+            cache_path.write_bytes(
+                b'{"cached_at":' + orjson.dumps(time.time())
+                + b',"query":' + orjson.dumps(key)
+                + b',"organization":' + organization.model_dump_json().encode('utf-8') + b'}'
+            )
         except Exception as e:
             logger.error(f"Error saving cache for {key}: {str(e)}")
+        
+        self._remember(key, organization, self.cache_days * 86400)
     
     def is_valid(self, key: str) -> bool:
         """Check if cache entry exists and is still valid"""
         return self.get(key) is not None
 
 
+@functools.lru_cache(maxsize=None)
+def shared_file_cache(cache_dir: str = "cache", cache_days: int = 7) -> FileCacheStrategy:
+    """Process-wide FileCacheStrategy per directory, so repeated batches share its memory layer"""
+    return FileCacheStrategy(cache_dir, cache_days)
+
+
 class NoCacheStrategy(CacheStrategy):
     """No-op cache implementation for when caching is disabled"""
     
     def get(self, key: str) -> Optional[Organization]:
         return None
     
+    async def aget(self, key: str) -> Optional[Organization]:
+        return None
+    
     def set(self, key: str, organization: Organization) -> None:
         pass
     
+    async def aset(self, key: str, organization: Organization) -> None:
+        pass
+    
     def is_valid(self, key: str) -> bool:
-        return False
\ No newline at end of file
+        return False
+
+
+class FileResponseCache:
+    """File-based cache of raw HTTP response bodies"""
+    
+    def __init__(self, cache_dir: str = "cache/http", expire_hours: int = 24):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.expire_seconds = expire_hours * 3600
+    
+    def _get_cache_path(self, key: str) -> Path:
+        """Generate cache file path from request key"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.body"
+    
+    def _get_validators_path(self, key: str) -> Path:
+        return self._get_cache_path(key).with_suffix('.meta')
+    
+    def get(self, key: str, allow_stale: bool = False) -> Optional[bytes]:
+        """Retrieve response body; expired entries are returned only when allow_stale is set"""
+        cache_path = self._get_cache_path(key)
+        try:
+            if not allow_stale and time.time() - cache_path.stat().st_mtime >= self.expire_seconds:
+                return None
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading response cache for {key}: {str(e)}")
+            return None
+    
+    def get_validators(self, key: str) -> Dict[str, str]:
+        """ETag / Last-Modified headers stored with the response, for conditional requests"""
+        try:
+            return orjson.loads(self._get_validators_path(key).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error reading response validators for {key}: {str(e)}")
+            return {}
+    
+    def refresh(self, key: str) -> None:
+        """Mark a stored response as fresh again after the server confirmed it is unchanged"""
+        try:
+            self._get_cache_path(key).touch()
+        except Exception as e:
+            logger.error(f"Error refreshing response cache for {key}: {str(e)}")
+    
+    def set(self, key: str, body: bytes, validators: Optional[Dict[str, str]] = None) -> None:
+        """Store response body along with its validators"""
+        cache_path = self._get_cache_path(key)
+        try:
+            cache_path.write_bytes(body)
+            validators_path = self._get_validators_path(key)
+            if validators:
+                validators_path.write_bytes(orjson.dumps(validators))
+            else:
+                validators_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Error saving response cache for {key}: {str(e)}")
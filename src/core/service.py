@@ -1,20 +1,104 @@
 import asyncio
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import threading
+import warnings
+from typing import List, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+import aiohttp
+
 from ..interfaces import OrganizationScraper, CacheStrategy
 from ..scrapers import (
     RusprofileScraperImpl,
     ListOrgScraperImpl,
     ZachemINNScraperImpl
 )
-from ..cache import FileCacheStrategy, NoCacheStrategy
+from ..cache import NoCacheStrategy, FileResponseCache, shared_file_cache
 from ..models import Organization, SimpleOrganization
+from ..utils import SingleFlight
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_EMPTY_ORGANIZATION = {
+    "name": None,
+    "inn": None,
+    "ogrn": None,
+    "kpp": None,
+    "okved": None,
+    "okved_additional": [],
+    "address": None,
+    "phone": None,
+    "email": None,
+    "director": None,
+    "registration_date": None,
+    "status": None,
+    "region": None
+}
+
+_NAME_QUOTES_RE = re.compile(r'[«»“”„"\']')
+_NAME_SPACES_RE = re.compile(r'\s+')
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize organization name so that spelling variants share one search"""
+    return _NAME_SPACES_RE.sub(' ', _NAME_QUOTES_RE.sub('', name)).strip().casefold()
+
+
+def _compact_prefixes(prefixes: List[str]) -> Tuple[str, ...]:
+    """Drop duplicate prefixes and ones covered by a shorter prefix ('47.74' covers '47.74.1')"""
+    compact: List[str] = []
+    # In sorted order a covering prefix always directly precedes the codes it covers
+    for prefix in sorted(set(prefixes)):
+        if not compact or not prefix.startswith(compact[-1]):
+            compact.append(prefix)
+    return tuple(compact)
+
+
+_DEFAULT_THREAD_POOL_SIZE = 32
+
+
+def _thread_pool_size() -> int:
+    """Worker count for thread-offloaded scrapers, overridable with EGRN_THREAD_POOL_SIZE"""
+    value = os.environ.get("EGRN_THREAD_POOL_SIZE")
+    if value is None:
+        return _DEFAULT_THREAD_POOL_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Invalid EGRN_THREAD_POOL_SIZE {value!r}, using {_DEFAULT_THREAD_POOL_SIZE}")
+        return _DEFAULT_THREAD_POOL_SIZE
+
+
+class _LoopRunner:
+    """Event loop running in a daemon thread, reused by every synchronous search"""
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Sized for I/O-bound scrapers offloaded with asyncio.to_thread
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=_thread_pool_size(), thread_name_prefix="egrn")
+                )
+                threading.Thread(target=loop.run_forever, name="egrn-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+    
+    def run(self, coro):
+        """Run coroutine on the background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_loop_runner = _LoopRunner()
+
 
 class OrganizationSearchService:
     """Service for searching organizations following SOLID principles"""
@@ -23,17 +107,47 @@ class OrganizationSearchService:
         self,
         scrapers: Optional[List[OrganizationScraper]] = None,
         cache_strategy: Optional[CacheStrategy] = None,
-        max_workers: int = 3,
-        okved_filters: Optional[List[str]] = None
+        max_workers: Optional[int] = None,
+        okved_filters: Optional[List[str]] = None,
+        response_cache: Optional[FileResponseCache] = None,
+        max_connections: int = 64
     ):
+        if max_workers is not None:
+            warnings.warn(
+                "max_workers is ignored since searches run on aiohttp; use max_connections instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
         self.scrapers = scrapers or [
-            RusprofileScraperImpl(),
-            ListOrgScraperImpl(),
-            ZachemINNScraperImpl()
+            RusprofileScraperImpl(response_cache),
+            ListOrgScraperImpl(response_cache),
+            ZachemINNScraperImpl(response_cache)
         ]
-        self.cache = cache_strategy or FileCacheStrategy()
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cache = cache_strategy or shared_file_cache()
+        self.max_connections = max_connections
         self.okved_filters = okved_filters
+        self._okved_prefixes = _compact_prefixes(okved_filters or [])
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Searches currently running, keyed by (normalized name, region)
+        self._inflight = SingleFlight()
+    
+    async def __aenter__(self) -> 'OrganizationSearchService':
+        """Keep one HTTP session open for all batches searched inside the block"""
+        self._session = self._create_session()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=8,  # Politeness limit per scraped site
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(connector=connector)
     
     def _matches_okved_filter(self, organization: Organization) -> bool:
         """Check if organization matches OKVED filters"""
@@ -43,69 +157,164 @@ class OrganizationSearchService:
         if not organization.okved:
             return False
         
-        # Check main OKVED
-        for okved_filter in self.okved_filters:
-            if organization.okved.startswith(okved_filter):
-                return True
+        # Check main OKVED against all prefixes in one call
+        if organization.okved.startswith(self._okved_prefixes):
+            return True
         
-        # Check additional OKVEDs if available
-        if hasattr(organization, 'okved_additional'):
-            for add_okved in organization.okved_additional:
-                for okved_filter in self.okved_filters:
-                    if add_okved.startswith(okved_filter):
-                        return True
+        # Check additional OKVEDs (always present on the model, possibly empty)
+        return any(add_okved.startswith(self._okved_prefixes) for add_okved in organization.okved_additional)
+    
+    def _lookup_cache(self, name: str) -> Tuple[bool, Optional[Organization]]:
+        """Return (hit, organization) for a cached query, applying OKVED filters"""
+        return self._check_cached(name, self.cache.get(name))
+    
+    async def _lookup_cache_async(self, name: str) -> Tuple[bool, Optional[Organization]]:
+        """Async variant of _lookup_cache that keeps file reads off the event loop"""
+        return self._check_cached(name, await self.cache.aget(name))
+    
+    def _check_cached(self, name: str, cached: Optional[Organization]) -> Tuple[bool, Optional[Organization]]:
+        if not cached:
+            return False, None
         
-        return False
+        logger.info(f"Found in cache: {name}")
+        # Apply OKVED filter even for cached results
+        if self._matches_okved_filter(cached):
+            return True, cached
+        
+        logger.info(f"Cached result for {name} doesn't match OKVED filter")
+        return True, None
+    
+    def _is_accepted(self, name: str, result: Optional[Organization]) -> bool:
+        """Check scraped result against OKVED filters"""
+        if not result:
+            return False
+        
+        # Apply OKVED filter
+        if not self._matches_okved_filter(result):
+            logger.info(f"Found {name} but doesn't match OKVED filter")
+            return False
+        return True
+    
+    def _search_with_scraper(self, scraper: OrganizationScraper, name: str, region: str) -> Optional[Organization]:
+        try:
+            logger.info(f"Searching {name} using {scraper.get_scraper_name()}")
+            return scraper.search_filtered(name, region, self._okved_prefixes)
+        except Exception as e:
+            logger.error(f"Error in {scraper.get_scraper_name()}: {str(e)}")
+            return None
     
     def search_single(self, name: str, region: str = "Тюменская область") -> Optional[Organization]:
         """Search for a single organization"""
         # Check cache first
-        cached = self.cache.get(name)
-        if cached:
-            logger.info(f"Found in cache: {name}")
-            # Apply OKVED filter even for cached results
-            if self._matches_okved_filter(cached):
-                return cached
-            else:
-                logger.info(f"Cached result for {name} doesn't match OKVED filter")
-                return None
+        hit, cached = self._lookup_cache(name)
+        if hit:
+            return cached
         
-        # Try each scraper
-        for scraper in self.scrapers:
-            try:
-                logger.info(f"Searching {name} using {scraper.get_scraper_name()}")
-                result = scraper.search_organization(name, region)
-                if result:
-                    # Apply OKVED filter
-                    if self._matches_okved_filter(result):
-                        # Save to cache
-                        self.cache.set(name, result)
-                        return result
-                    else:
-                        logger.info(f"Found {name} but doesn't match OKVED filter")
-            except Exception as e:
-                logger.error(f"Error in {scraper.get_scraper_name()}: {str(e)}")
-                continue
+        # Query all scrapers at once and take the first accepted result
+        executor = ThreadPoolExecutor(max_workers=max(1, len(self.scrapers)))
+        futures = [
+            executor.submit(self._search_with_scraper, scraper, name, region)
+            for scraper in self.scrapers
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if self._is_accepted(name, result):
+                    # Save to cache
+                    self.cache.set(name, result)
+                    return result
+        finally:
+            # Don't wait for slower scrapers once a result is accepted
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return None
     
-    async def search_multiple_async(self, names: List[str], region: str = "Тюменская область") -> List[Optional[Organization]]:
-        """Search for multiple organizations asynchronously"""
-        loop = asyncio.get_event_loop()
+    async def search_single_async(
+        self,
+        session: aiohttp.ClientSession,
+        name: str,
+        region: str = "Тюменская область"
+    ) -> Optional[Organization]:
+        """Search for a single organization using a shared HTTP session"""
+        # Check cache first
+        hit, cached = await self._lookup_cache_async(name)
+        if hit:
+            return cached
         
-        # Create tasks for parallel search
+        # Query all scrapers at once and take the first accepted result
         tasks = [
-            loop.run_in_executor(self.executor, self.search_single, name, region)
-            for name in names
+            asyncio.create_task(self._search_with_scraper_async(scraper, session, name, region))
+            for scraper in self.scrapers
         ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if self._is_accepted(name, result):
+                    # Save to cache without blocking the event loop
+                    await self.cache.aset(name, result)
+                    return result
+        finally:
+            # Cancel slower scrapers so they release their connections
+            for task in tasks:
+                task.cancel()
+        
+        return None
+    
+    async def _search_with_scraper_async(
+        self,
+        scraper: OrganizationScraper,
+        session: aiohttp.ClientSession,
+        name: str,
+        region: str
+    ) -> Optional[Organization]:
+        try:
+            logger.info(f"Searching {name} using {scraper.get_scraper_name()}")
+            return await scraper.search_filtered_async(name, region, session, self._okved_prefixes)
+        except Exception as e:
+            logger.error(f"Error in {scraper.get_scraper_name()}: {str(e)}")
+            return None
+    
+    async def search_multiple_async(self, names: List[str], region: str = "Тюменская область") -> List[Optional[Organization]]:
+        """Search for multiple organizations asynchronously"""
+        # Search each distinct name once, keeping the first spelling seen
+        unique_names: Dict[str, str] = {}
+        for name in names:
+            unique_names.setdefault(_normalize_name(name), name)
         
-        # Wait for all results
-        results = await asyncio.gather(*tasks)
-        return results
+        if self._session is not None:
+            results = await self._gather_searches(self._session, unique_names.values(), region)
+        else:
+            async with self._create_session() as session:
+                results = await self._gather_searches(session, unique_names.values(), region)
+        
+        found = dict(zip(unique_names, results))
+        return [found[_normalize_name(name)] for name in names]
+    
+    async def _gather_searches(
+        self,
+        session: aiohttp.ClientSession,
+        names: Iterable[str],
+        region: str
+    ) -> List[Optional[Organization]]:
+        # Issue all searches upfront and gather results as they complete
+        tasks = [self._dedup_search(session, name, region) for name in names]
+        return await asyncio.gather(*tasks)
+    
+    async def _dedup_search(
+        self,
+        session: aiohttp.ClientSession,
+        name: str,
+        region: str
+    ) -> Optional[Organization]:
+        """Share one in-flight search between concurrent callers asking for the same name"""
+        return await self._inflight.do(
+            (_normalize_name(name), region), lambda: self.search_single_async(session, name, region)
+        )
     
     def search_multiple(self, names: List[str], region: str = "Тюменская область") -> List[Optional[Organization]]:
         """Search for multiple organizations synchronously"""
-        return asyncio.run(self.search_multiple_async(names, region))
+        # Reuse one loop (and its thread pool) instead of setting up a new one per batch
+        return _loop_runner.run(self.search_multiple_async(names, region))
 
 
 def search_organizations(
@@ -116,10 +325,12 @@ def search_organizations(
 ) -> List[Dict]:
     
     # Initialize service with appropriate cache strategy and OKVED filters
-    cache_strategy = FileCacheStrategy() if use_cache else NoCacheStrategy()
+    cache_strategy = shared_file_cache() if use_cache else NoCacheStrategy()
+    response_cache = FileResponseCache() if use_cache else None
     service = OrganizationSearchService(
         cache_strategy=cache_strategy,
-        okved_filters=okved_filters
+        okved_filters=okved_filters,
+        response_cache=response_cache
     )
     
     # Search for organizations
@@ -129,46 +340,12 @@ def search_organizations(
     results = []
     for name, org in zip(organization_names, organizations):
         if org:
-            # Convert to cache format structure
-            result = {
-                "query": name,
-                "organization": {
-                    "name": org.name,
-                    "inn": org.inn,
-                    "ogrn": org.ogrn,
-                    "kpp": org.kpp if hasattr(org, 'kpp') else None,
-                    "okved": org.okved,
-                    "okved_additional": org.okved_additional if hasattr(org, 'okved_additional') else [],
-                    "address": org.address,
-                    "phone": org.phone if hasattr(org, 'phone') else None,
-                    "email": org.email if hasattr(org, 'email') else None,
-                    "director": org.director,
-                    "registration_date": org.registration_date.isoformat() if org.registration_date else None,
-                    "status": org.status,
-                    "region": org.region
-                }
-            }
-            results.append(result)
+            # Pydantic serializes the whole model (including dates) in one call
+            organization = org.model_dump(mode='json')
         else:
             # Return empty result in cache format
-            results.append({
-                "query": name,
-                "organization": {
-                    "name": None,
-                    "inn": None,
-                    "ogrn": None,
-                    "kpp": None,
-                    "okved": None,
-                    "okved_additional": [],
-                    "address": None,
-                    "phone": None,
-                    "email": None,
-                    "director": None,
-                    "registration_date": None,
-                    "status": None,
-                    "region": None
-                }
-            })
+            organization = dict(_EMPTY_ORGANIZATION, okved_additional=[])
+        results.append({"query": name, "organization": organization})
     
     return results
 
@@ -1,5 +1,11 @@
+import asyncio
+import functools
+import inspect
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Protocol
+from typing import Callable, Optional, Dict, Iterable, List, Protocol, Tuple, Union
+
+from aiohttp import ClientSession
+
 from ..models import Organization
 
 
@@ -13,12 +19,84 @@ class HtmlParser(Protocol):
         ...
 
 
+@functools.lru_cache(maxsize=None)
+def _accepts_okved_prefixes(func: Callable) -> bool:
+    """Whether a search method takes okved_prefixes; scrapers written before the filter existed don't"""
+    return any(
+        parameter.name == 'okved_prefixes' or parameter.kind is parameter.VAR_KEYWORD
+        for parameter in inspect.signature(func).parameters.values()
+    )
+
+
+def _okved_kwargs(method: Callable, okved_prefixes: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    # Look up the plain function, so the cache holds one entry per scraper class
+    if _accepts_okved_prefixes(getattr(method, '__func__', method)):
+        return {'okved_prefixes': okved_prefixes}
+    return {}
+
+
 class OrganizationScraper(ABC):
     
     @abstractmethod
-    def search_organization(self, name: str, region: str = "Тюменская область") -> Optional[Organization]:
+    def search_organization(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        """Find organization; okved_prefixes lets scrapers skip non-matching candidates early"""
         pass
     
+    async def search_organization_async(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        session: Optional[ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        """Async search; scrapers without native async support run in a worker thread"""
+        return await asyncio.to_thread(self.search_filtered, name, region, okved_prefixes)
+    
+    def search_filtered(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        """Call search_organization, passing okved_prefixes only if the scraper accepts it"""
+        return self.search_organization(
+            name, region, **_okved_kwargs(self.search_organization, okved_prefixes)
+        )
+    
+    async def search_filtered_async(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        session: Optional[ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        """Call search_organization_async, passing okved_prefixes only if the scraper accepts it"""
+        return await self.search_organization_async(
+            name, region, session, **_okved_kwargs(self.search_organization_async, okved_prefixes)
+        )
+    
+    async def search_many(
+        self,
+        names: Iterable[str],
+        region: str = "Тюменская область",
+        session: Optional[ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = (),
+        concurrency: int = 16
+    ) -> List[Optional[Organization]]:
+        """Search several names concurrently, keeping at most `concurrency` searches in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def search(name: str) -> Optional[Organization]:
+            async with semaphore:
+                return await self.search_filtered_async(name, region, session, okved_prefixes)
+        
+        return await asyncio.gather(*(search(name) for name in names))
+    
     @abstractmethod
     def get_scraper_name(self) -> str:
         pass
@@ -27,7 +105,8 @@ class OrganizationScraper(ABC):
 class OrganizationDataTransformer(ABC):
     
     @abstractmethod
-    def transform(self, raw_data: Dict) -> Optional[Organization]:
+    def transform(self, raw_data: Union[bytes, Dict]) -> Optional[Organization]:
+        """Build organization from raw UTF-8 page bytes or a decoded API record"""
         pass
 
 
@@ -37,10 +116,18 @@ class CacheStrategy(ABC):
     def get(self, key: str) -> Optional[Organization]:
         pass
     
+    async def aget(self, key: str) -> Optional[Organization]:
+        """Async lookup; file I/O runs in a worker thread so hits don't block the event loop"""
+        return await asyncio.to_thread(self.get, key)
+    
     @abstractmethod
     def set(self, key: str, organization: Organization) -> None:
         pass
     
+    async def aset(self, key: str, organization: Organization) -> None:
+        """Async store; file I/O runs in a worker thread so writes don't block the event loop"""
+        await asyncio.to_thread(self.set, key, organization)
+    
     @abstractmethod
     def is_valid(self, key: str) -> bool:
         pass
\ No newline at end of file
@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
 
 class Organization(BaseModel):
+    # Scrapers may pass fields the model doesn't track (e.g. capital)
+    model_config = ConfigDict(extra='ignore')
+    
     name: str = Field(..., description="Название организации")
     inn: Optional[str] = Field(None, description="ИНН")
     ogrn: Optional[str] = Field(None, description="ОГРН")
@@ -17,11 +20,6 @@ class Organization(BaseModel):
     registration_date: Optional[datetime] = Field(None, description="Дата регистрации")
     status: Optional[str] = Field(None, description="Статус организации")
     region: str = Field(default="Тюменская область", description="Регион")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
 
 
 class SearchRequest(BaseModel):
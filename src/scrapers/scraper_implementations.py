@@ -1,100 +1,580 @@
+import asyncio
+import codecs
+import io
+import orjson
 import requests
-from bs4 import BeautifulSoup
-import time
-from typing import Optional, Dict
-from fake_useragent import UserAgent
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+import aiohttp
+import lxml.html
+from lxml import etree
 import re
+import time
+import random
+import threading
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Iterable, List, Tuple
+from urllib.parse import urlparse
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from tenacity.wait import wait_base
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 import logging
 
 from ..interfaces import OrganizationScraper, OrganizationDataTransformer
 from ..models import Organization
+from ..cache import FileResponseCache
+from ..utils import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+try:
+    import brotli  # noqa: F401  # enables 'br' decoding in requests and aiohttp
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ru-RU,ru;q=0.9,en;q=0.8',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Static pool of current desktop browsers; avoids loading a user agent dataset at startup
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 YaBrowser/24.1.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) '
+    'Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0'
+)
+
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_html_parsers = threading.local()
+
+
+def _to_utf8(content: bytes, charset: Optional[str]) -> bytes:
+    """Normalize response body to UTF-8, transcoding only when the server declared another charset"""
+    try:
+        codec = codecs.lookup(charset) if charset else None
+    except LookupError:
+        # Label Python doesn't know (e.g. utf8mb4): keep the page, replacing bytes that aren't UTF-8
+        return content.decode('utf-8', errors='replace').encode('utf-8')
+    if codec is None or codec.name == 'utf-8':
+        return content
+    return content.decode(codec.name, errors='replace').encode('utf-8')
+
+
+def _get_charset(content_type: Optional[str]) -> Optional[str]:
+    match = _CHARSET_RE.search(content_type or '')
+    return match.group(1) if match else None
+
+
+def _parse_html(body: bytes) -> lxml.html.HtmlElement:
+    """Parse UTF-8 bytes with an explicit encoding, skipping charset detection"""
+    # lxml parsers must not be shared between threads
+    parser = getattr(_html_parsers, 'parser', None)
+    if parser is None:
+        parser = _html_parsers.parser = lxml.html.HTMLParser(encoding='utf-8')
+    return lxml.html.fromstring(body, parser=parser)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching an element with the given CSS class"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(xpath: etree.XPath, doc) -> Optional[etree._Element]:
+    return next(iter(xpath(doc)), None)
+
+
+def _text(element: etree._Element) -> str:
+    return ''.join(element.itertext()).strip()
+
+
+def _joined_text(element: etree._Element) -> str:
+    """Concatenate stripped text fragments, like BeautifulSoup get_text(strip=True)"""
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+
+def _leading_code(value: str) -> Optional[str]:
+    """Code part of an 'OKVED code + description' value"""
+    parts = value.split(None, 1)
+    return parts[0] if parts else None
+
+
+def _parse_api_date(value) -> Optional[datetime]:
+    """Parse the leading YYYY-MM-DD part of an API date without raising on other shapes"""
+    if not isinstance(value, str) or len(value) < 10 or value[4] != '-' or value[7] != '-':
+        return None
+    year, month, day = value[:4], value[5:7], value[8:10]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:  # Out-of-range month or day
+        return None
+
+
+def _iter_elements_with_class(html: bytes, tag: str, class_name: str):
+    """Stream elements with the given class as soon as they are parsed"""
+    for _, element in etree.iterparse(io.BytesIO(html), events=('end',), tag=tag, html=True, encoding='utf-8'):
+        if class_name in (element.get('class') or '').split():
+            yield element
+
+
+# Company page selectors are compiled once and evaluated by libxml2
+_RUSPROFILE_TITLE = etree.XPath(f"//h1[{_has_class('company-name')}]")
+# INN and OGRN come back from a single pass over the requisites block
+_RUSPROFILE_REQUISITES = etree.XPath(
+    "//div[@id='requisites']//span[@id='clip_inn' or @id='clip_ogrn']"
+)
+_REQUISITE_FIELDS = {'clip_inn': 'inn', 'clip_ogrn': 'ogrn'}
+# Label-anchored lookups: value is the first span in the element right after the label
+_RUSPROFILE_KPP = etree.XPath(
+    "//div[@id='requisites']//*[starts-with(normalize-space(text()), 'КПП')]"
+    "/following-sibling::*[1]/descendant-or-self::span[1]"
+)
+_RUSPROFILE_OKVED = etree.XPath(f"//span[@id='okved2_main']//span[{_has_class('okved-code')}]")
+_RUSPROFILE_ADDRESS = etree.XPath("//address")
+_RUSPROFILE_DIRECTOR = etree.XPath(
+    f"//div[{_has_class('company-row')}][.//text()[contains(., 'Руководитель')]]/descendant::a[1]"
+)
+_RUSPROFILE_STATUS = etree.XPath(f"//div[{_has_class('company-status')}]")
+
+# Search result card selectors, evaluated relative to a card element
+_CARD_TITLE = etree.XPath(f".//div[{_has_class('company-item__title')}]")
+_CARD_INFO_ROWS = etree.XPath(f".//div[{_has_class('company-item-info')}]//dl")
+_CARD_ROWS = etree.XPath(".//dl")
+_CARD_ADDRESS = etree.XPath(f".//address[{_has_class('company-item__text')}]")
+_ROW_TERM = etree.XPath(".//dt")
+_ROW_DEFINITION = etree.XPath(".//dd")
+_ANY_LINK = etree.XPath(".//a")
+
+_CLASS_COMPANY_ITEM = 'company-item'
+_CLASS_ORG_LIST = 'org_list'
+
+_LISTORG_TITLE = etree.XPath("//h1")
+_LISTORG_TABLE = etree.XPath(f"//table[{_has_class('table')}]")
+_LISTORG_ROWS = etree.XPath(".//tr")
+_LISTORG_CELLS = etree.XPath("./td")
+
+
+# Genitive month names as used in Russian dates
+_RU_MONTHS = MappingProxyType({
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+})
+
+# Day, month name and year of a date like "12 марта 2015 г."
+_RU_DATE_RE = re.compile(r'(\d{1,2})\s+(\S+)\s+(\d{4})')
+
+
+def _set_field(field: str) -> Callable[[str, Dict], None]:
+    """Build a row handler storing the value under the given field"""
+    def set_value(value: str, org_data: Dict) -> None:
+        org_data[field] = value
+    return set_value
+
+
+def _set_okved(value: str, org_data: Dict) -> None:
+    # Extract OKVED code
+    org_data['okved'] = _leading_code(value)
+
+
+def _set_first_okved(value: str, org_data: Dict) -> None:
+    # Only the first OKVED row holds the main activity
+    if 'okved' not in org_data:
+        org_data['okved'] = _leading_code(value)
+
+
+def _set_registration_date(value: str, org_data: Dict) -> None:
+    match = _RU_DATE_RE.match(value)
+    if match:
+        day, month, year = match.groups()
+        try:
+            org_data['registration_date'] = datetime(int(year), _RU_MONTHS.get(month, 1), int(day))
+        except ValueError:  # Out-of-range day
+            pass
+
+
+# Rusprofile search card: row label -> handler
+_SEARCH_CARD_FIELDS: Dict[str, Callable[[str, Dict], None]] = {
+    'ИНН': _set_field('inn'),
+    'ОГРН': _set_field('ogrn'),
+    'Дата регистрации': _set_registration_date,
+    'Основной вид деятельности': _set_okved,
+    'Директор': _set_field('director'),
+    'Генеральный директор': _set_field('director')
+}
+
+# List-org requisites table: the first keyword found in the lowercased label wins
+_LISTORG_FIELDS: Tuple[Tuple[str, Callable[[str, Dict], None]], ...] = (
+    ('инн', _set_field('inn')),
+    ('огрн', _set_field('ogrn')),
+    ('кпп', _set_field('kpp')),
+    ('адрес', _set_field('address')),
+    ('телефон', _set_field('phone')),
+    ('оквэд', _set_first_okved)
+)
+
+
+# Response headers kept with cached bodies and the request headers that send them back
+_VALIDATOR_HEADERS = (('ETag', 'If-None-Match'), ('Last-Modified', 'If-Modified-Since'))
+
+
+def _get_validators(headers) -> Dict[str, str]:
+    """Cache validators present in response headers"""
+    return {name: headers[name] for name, _ in _VALIDATOR_HEADERS if name in headers}
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _retry_after_from_error(error: BaseException) -> Optional[float]:
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        headers = error.response.headers
+    elif isinstance(error, aiohttp.ClientResponseError):
+        headers = error.headers
+    else:
+        return None
+    return _parse_retry_after(headers.get('Retry-After')) if headers else None
+
+
+class _WaitRetryAfter(wait_base):
+    """Wait as long as the server's Retry-After asks, otherwise defer to the fallback strategy"""
+    
+    def __init__(self, fallback: wait_base, max_wait: float = 60.0):
+        self.fallback = fallback
+        self.max_wait = max_wait
+    
+    def __call__(self, retry_state) -> float:
+        error = retry_state.outcome.exception()
+        delay = _retry_after_from_error(error) if error else None
+        if delay is None:
+            return self.fallback(retry_state)
+        return min(delay, self.max_wait)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry network failures, timeouts, 429 and 5xx; other client errors won't change on retry"""
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+    elif isinstance(error, aiohttp.ClientResponseError):
+        status = error.status
+    else:
+        return isinstance(error, (requests.RequestException, aiohttp.ClientError, asyncio.TimeoutError))
+    return status is None or status == 429 or status >= 500
+
+
+# Full jitter keeps concurrent workers from retrying a failing host in lockstep
+_RETRY_WAIT = _WaitRetryAfter(wait_random_exponential(multiplier=1, max=10))
+
+
+class HostRateLimiter:
+    """Per-host token bucket; different hosts don't wait for each other and 429s slow a host down"""
+    
+    def __init__(self, requests_per_second: float = 2.0, burst: int = 1, max_interval: float = 30.0):
+        self.interval = 1 / requests_per_second
+        self.burst = burst
+        self.max_interval = max_interval
+        # Time the next request to each host is due (the GCRA form of a token bucket)
+        self._next_slot: Dict[str, float] = defaultdict(float)
+        # Spacing for hosts that asked us to slow down
+        self._intervals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, url: str) -> float:
+        """Reserve the next request slot for the URL's host and return seconds to wait for it"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            interval = self._intervals.get(host, self.interval)
+            slot = max(now, self._next_slot[host])
+            self._next_slot[host] = slot + interval
+            if interval > self.interval:
+                # Recover gradually from an earlier backoff
+                self._intervals[host] = max(self.interval, interval * 0.9)
+        # Up to `burst` requests may go out back to back
+        return max(0.0, slot - now - (self.burst - 1) * interval)
+    
+    def backoff(self, url: str, retry_after: Optional[float] = None) -> None:
+        """Halve the host's rate and hold its next slot until Retry-After (or one new interval)"""
+        host = urlparse(url).netloc
+        with self._lock:
+            interval = min(self.max_interval, self._intervals.get(host, self.interval) * 2)
+            self._intervals[host] = interval
+            pause = retry_after if retry_after is not None else interval
+            self._next_slot[host] = max(self._next_slot[host], time.monotonic() + pause)
+    
+    def wait(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Shared by all scrapers so politeness holds across service instances
+_rate_limiter = HostRateLimiter()
+
 
 class BaseHttpScraper(OrganizationScraper):
     
-    def __init__(self):
-        self.ua = UserAgent()
+    def __init__(self, response_cache: Optional[FileResponseCache] = None):
         self.session = requests.Session()
+        # Keep connections alive across requests; retries are handled by tenacity
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # One user agent per scraper instance; headers are built once and reused for every request
+        self._headers = MappingProxyType(self._get_headers())
+        self.session.headers.update(self._headers)
+        self.response_cache = response_cache
+        self.rate_limiter = _rate_limiter
+        # Requests in flight (including retry backoff), keyed by cache key
+        self._pending_fetches = SingleFlight()
     
     def _get_headers(self) -> Dict[str, str]:
-        return {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ru-RU,ru;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        return {**_BASE_HEADERS, 'User-Agent': random.choice(_USER_AGENTS)}
+    
+    async def search_many(
+        self,
+        names: Iterable[str],
+        region: str = "Тюменская область",
+        session: Optional[aiohttp.ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = (),
+        concurrency: int = 16
+    ) -> List[Optional[Organization]]:
+        if session is None:
+            # Open a session for the batch so searches go through aiohttp instead of threads
+            async with aiohttp.ClientSession() as session:
+                return await super().search_many(names, region, session, okved_prefixes, concurrency)
+        return await super().search_many(names, region, session, okved_prefixes, concurrency)
+    
+    @retry(stop=stop_after_attempt(3), wait=_RETRY_WAIT, retry=retry_if_exception(_is_retryable))
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
+        if response.status_code == 429:
+            self.rate_limiter.backoff(url, _parse_retry_after(response.headers.get('Retry-After')))
+        response.raise_for_status()
+        return response
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> requests.Response:
-        response = self.session.get(
+    @retry(stop=stop_after_attempt(3), wait=_RETRY_WAIT, retry=retry_if_exception(_is_retryable))
+    async def _make_request_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Return UTF-8 body and cache validators; body is None for 304 Not Modified"""
+        async with session.get(
             url,
             params=params,
-            headers=self._get_headers(),
-            timeout=10
+            headers={**self._headers, **headers} if headers else self._headers,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 429:
+                self.rate_limiter.backoff(url, _parse_retry_after(response.headers.get('Retry-After')))
+            response.raise_for_status()
+            if response.status == 304:
+                return None, {}
+            return _to_utf8(await response.read(), response.charset), _get_validators(response.headers)
+    
+    def _get_cache_key(self, url: str, params: Optional[Dict] = None) -> str:
+        query = '&'.join(f"{k}={v}" for k, v in sorted(params.items())) if params else ''
+        return f"{self.get_scraper_name()} {url}?{query}"
+    
+    def _get_cached_response(self, key: str, allow_stale: bool = False) -> Optional[bytes]:
+        if not self.response_cache:
+            return None
+        return self.response_cache.get(key, allow_stale=allow_stale)
+    
+    def _get_conditional_headers(self, key: str) -> Optional[Dict[str, str]]:
+        """If-None-Match / If-Modified-Since for revalidating an expired cached response"""
+        if not self.response_cache:
+            return None
+        validators = self.response_cache.get_validators(key)
+        return {
+            request_header: validators[name]
+            for name, request_header in _VALIDATOR_HEADERS if name in validators
+        } or None
+    
+    def _on_not_modified(self, key: str) -> Optional[bytes]:
+        """Serve the expired cached body after a 304, marking it fresh again"""
+        body = self._get_cached_response(key, allow_stale=True)
+        if body is not None:
+            self.response_cache.refresh(key)
+        return body
+    
+    def _stale_or_raise(self, key: str, url: str, error: Exception) -> bytes:
+        """Fall back to an expired cached body when the request failed, re-raising if there is none"""
+        stale = self._get_cached_response(key, allow_stale=True)
+        if stale is None:
+            raise error
+        logger.warning(f"Using stale cached response for {url}")
+        return stale
+    
+    def _store(self, key: str, body: bytes, validators: Dict[str, str]) -> bytes:
+        """Save a fresh response body with its validators and return it"""
+        if self.response_cache:
+            self.response_cache.set(key, body, validators)
+        return body
+    
+    async def _run_cache_io(self, func: Callable, *args):
+        """Run a response cache step in a worker thread, keeping file I/O off the event loop"""
+        if not self.response_cache:
+            # Nothing to read or write, so skip the thread hop
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+    
+    def _fetch(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """Fetch UTF-8 response body, serving repeated requests from the response cache"""
+        key = self._get_cache_key(url, params)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        # Search and company pages alike wait for the host's slot; cached responses never do
+        self.rate_limiter.wait(url)
+        
+        try:
+            response = self._make_request(url, params, self._get_conditional_headers(key))
+            if response.status_code == 304:
+                revalidated = self._on_not_modified(key)
+                if revalidated is not None:
+                    return revalidated
+                # Cached body vanished meanwhile, fetch it again in full
+                response = self._make_request(url, params)
+            body = _to_utf8(response.content, _get_charset(response.headers.get('Content-Type')))
+            validators = _get_validators(response.headers)
+        except Exception as e:
+            return self._stale_or_raise(key, url, e)
+        
+        return self._store(key, body, validators)
+    
+    async def _fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict] = None
+    ) -> bytes:
+        """Async version of _fetch sharing the same response cache"""
+        key = self._get_cache_key(url, params)
+        cached = await self._run_cache_io(self._get_cached_response, key)
+        if cached is not None:
+            return cached
+        
+        # Join a request already in flight for the same URL instead of issuing (and retrying) it twice
+        return await self._pending_fetches.do(
+            key, lambda: self._fetch_uncached_async(session, url, params, key)
         )
-        response.raise_for_status()
-        return response
+    
+    def _fetch_and_transform(self, url: str, transformer: OrganizationDataTransformer) -> Optional[Organization]:
+        """Fetch a company page and turn it into an Organization"""
+        try:
+            html = self._fetch(url)
+            return transformer.transform(html)
+        except Exception as e:
+            logger.error(f"Error parsing company page {url}: {str(e)}")
+            return None
+    
+    async def _fetch_and_transform_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        transformer: OrganizationDataTransformer
+    ) -> Optional[Organization]:
+        try:
+            html = await self._fetch_async(session, url)
+            return transformer.transform(html)
+        except Exception as e:
+            logger.error(f"Error parsing company page {url}: {str(e)}")
+            return None
+    
+    async def _fetch_uncached_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict],
+        key: str
+    ) -> bytes:
+        await self.rate_limiter.wait_async(url)  # Same per-host pacing as _fetch
+        
+        try:
+            body, validators = await self._make_request_async(
+                session, url, params, await self._run_cache_io(self._get_conditional_headers, key)
+            )
+            if body is None:
+                revalidated = await self._run_cache_io(self._on_not_modified, key)
+                if revalidated is not None:
+                    return revalidated
+                # Cached body vanished meanwhile, fetch it again in full
+                body, validators = await self._make_request_async(session, url, params)
+        except Exception as e:
+            return await self._run_cache_io(self._stale_or_raise, key, url, e)
+        
+        return await self._run_cache_io(self._store, key, body, validators)
 
 
 class RusprofileDataTransformer(OrganizationDataTransformer):
     
-    def transform(self, soup: BeautifulSoup) -> Optional[Organization]:
+    def transform(self, html: bytes) -> Optional[Organization]:
         try:
+            doc = _parse_html(html)
             org_data = {}
+            fields = (
+                ('name', _RUSPROFILE_TITLE),
+                ('kpp', _RUSPROFILE_KPP),
+                ('okved', _RUSPROFILE_OKVED),
+                ('address', _RUSPROFILE_ADDRESS),
+                ('director', _RUSPROFILE_DIRECTOR),
+                ('status', _RUSPROFILE_STATUS)
+            )
             
-            # Extract organization name
-            title = soup.find('h1', class_='company-name')
-            if title:
-                org_data['name'] = title.text.strip()
-            
-            # Extract requisites (INN, OGRN, KPP)
-            requisites = soup.find('div', id='requisites')
-            if requisites:
-                inn = requisites.find('span', {'id': 'clip_inn'})
-                if inn:
-                    org_data['inn'] = inn.text.strip()
-                
-                ogrn = requisites.find('span', {'id': 'clip_ogrn'})
-                if ogrn:
-                    org_data['ogrn'] = ogrn.text.strip()
-                
-                kpp_elem = requisites.find(text=re.compile('КПП'))
-                if kpp_elem:
-                    kpp_value = kpp_elem.find_next('span')
-                    if kpp_value:
-                        org_data['kpp'] = kpp_value.text.strip()
-            
-            # Extract OKVED
-            okved_section = soup.find('span', {'id': 'okved2_main'})
-            if okved_section:
-                okved_code = okved_section.find('span', class_='okved-code')
-                if okved_code:
-                    org_data['okved'] = okved_code.text.strip()
-            
-            # Extract address
-            address_elem = soup.find('address')
-            if address_elem:
-                org_data['address'] = address_elem.text.strip()
-            
-            # Extract director
-            director_section = soup.find('div', class_='company-row', text=re.compile('Руководитель'))
-            if director_section:
-                director_link = director_section.find_next('a')
-                if director_link:
-                    org_data['director'] = director_link.text.strip()
+            for field, xpath in fields:
+                element = _first(xpath, doc)
+                if element is not None:
+                    org_data[field] = _text(element)
             
-            # Extract status
-            status_elem = soup.find('div', class_='company-status')
-            if status_elem:
-                org_data['status'] = status_elem.text.strip()
+            for element in _RUSPROFILE_REQUISITES(doc):
+                org_data.setdefault(_REQUISITE_FIELDS[element.get('id')], _text(element))
             
-            return Organization(**org_data) if org_data else None
+            return Organization.model_construct(_fields_set=set(org_data), **org_data) if 'name' in org_data else None
             
         except Exception as e:
             logger.error(f"Error transforming Rusprofile data: {str(e)}")
@@ -103,8 +583,8 @@ class RusprofileDataTransformer(OrganizationDataTransformer):
 
 class RusprofileScraperImpl(BaseHttpScraper):
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, response_cache: Optional[FileResponseCache] = None):
+        super().__init__(response_cache)
         self.base_url = "https://www.rusprofile.ru"
         self.search_url = f"{self.base_url}/search"
         self.transformer = RusprofileDataTransformer()
@@ -112,114 +592,131 @@ class RusprofileScraperImpl(BaseHttpScraper):
     def get_scraper_name(self) -> str:
         return "RusprofileScraper"
     
-    def search_organization(self, name: str, region: str = "Тюменская область") -> Optional[Organization]:
+    def _get_search_params(self, name: str) -> Dict[str, str]:
+        return {
+            'query': name,
+            'type': 'ul',  # Search for legal entities
+            'region': '72'  # Tyumen region code
+        }
+    
+    def search_organization(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
         try:
-            params = {
-                'query': name,
-                'type': 'ul',  # Search for legal entities
-                'region': '72'  # Tyumen region code
-            }
+            html = self._fetch(self.search_url, self._get_search_params(name))
+            org, company_url = self._find_in_search_results(html, region, okved_prefixes)
             
-            response = self._make_request(self.search_url, params)
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Find search results
-            search_results = soup.find_all('div', class_='company-item')
-            
-            for result in search_results:
-                # Check region
-                if region.lower() not in result.text.lower():
-                    continue
-                
-                # Try to parse directly from search results
-                org = self._parse_search_result(result)
-                if org:
-                    return org
-                
-                # Fallback to company page
-                link = result.find('a')
-                if link and link.get('href'):
-                    company_url = self.base_url + link.get('href', '')
-                    return self._parse_company_page(company_url)
-            
-            return None
+            # Fallback to company page
+            if company_url:
+                return self._fetch_and_transform(company_url, self.transformer)
+            return org
             
         except Exception as e:
             logger.error(f"Error searching {name} on Rusprofile: {str(e)}")
             return None
     
-    def _parse_company_page(self, url: str) -> Optional[Organization]:
+    async def search_organization_async(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        session: Optional[aiohttp.ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        if session is None:
+            return await super().search_organization_async(name, region, okved_prefixes=okved_prefixes)
+        
         try:
-            time.sleep(1)  # Rate limiting
-            response = self._make_request(url)
-            soup = BeautifulSoup(response.text, 'lxml')
-            return self.transformer.transform(soup)
+            html = await self._fetch_async(session, self.search_url, self._get_search_params(name))
+            org, company_url = self._find_in_search_results(html, region, okved_prefixes)
+            
+            # Fallback to company page
+            if company_url:
+                return await self._fetch_and_transform_async(session, company_url, self.transformer)
+            return org
+            
         except Exception as e:
-            logger.error(f"Error parsing company page {url}: {str(e)}")
+            logger.error(f"Error searching {name} on Rusprofile: {str(e)}")
             return None
     
-    def _parse_search_result(self, company_item) -> Optional[Organization]:
+    def _find_in_search_results(
+        self,
+        html: bytes,
+        region: str,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Tuple[Optional[Organization], Optional[str]]:
+        """Return organization parsed from search results or company page URL to fetch"""
+        region_lc = region.lower()
+        # Cards are inspected while the page is parsed; parsing stops at the first match
+        for result in _iter_elements_with_class(html, 'div', _CLASS_COMPANY_ITEM):
+            # Check region against the card's address, or the whole card if it shows none
+            address = _first(_CARD_ADDRESS, result)
+            region_text = _text(address) if address is not None else ''.join(result.itertext())
+            if region_lc not in region_text.lower():
+                result.clear()
+                continue
+            
+            # Skip cards whose main OKVED is shown and doesn't match, before any page fetch
+            okved = self._get_search_result_okved(result)
+            if okved_prefixes and okved and not okved.startswith(okved_prefixes):
+                result.clear()
+                continue
+            
+            # Try to parse directly from search results
+            org = self._parse_search_result(result)
+            if org:
+                return org, None
+            
+            link = _first(_ANY_LINK, result)
+            if link is not None and link.get('href'):
+                return None, self.base_url + link.get('href', '')
+        
+        return None, None
+    
+    def _get_search_result_okved(self, company_item: etree._Element) -> Optional[str]:
+        """Main OKVED code shown on a search result card"""
+        for dl in _CARD_ROWS(company_item):
+            dt = _first(_ROW_TERM, dl)
+            dd = _first(_ROW_DEFINITION, dl)
+            if dt is not None and dd is not None and _text(dt) == 'Основной вид деятельности':
+                value = _text(dd)
+                return _leading_code(value)
+        return None
+    
+    def _parse_search_result(self, company_item: etree._Element) -> Optional[Organization]:
         try:
             org_data = {}
             
             # Extract name
-            title_elem = company_item.find('div', class_='company-item__title')
-            if title_elem and title_elem.find('a'):
-                org_data['name'] = title_elem.get_text(strip=True)
+            title_elem = _first(_CARD_TITLE, company_item)
+            if title_elem is not None and _first(_ANY_LINK, title_elem) is not None:
+                org_data['name'] = _joined_text(title_elem)
             
             # Extract INN, OGRN, registration date
-            info_sections = company_item.find_all('div', class_='company-item-info')
-            for section in info_sections:
-                dls = section.find_all('dl')
-                for dl in dls:
-                    dt = dl.find('dt')
-                    dd = dl.find('dd')
-                    if dt and dd:
-                        label = dt.text.strip()
-                        value = dd.text.strip()
-                        
-                        if label == 'ИНН':
-                            org_data['inn'] = value
-                        elif label == 'ОГРН':
-                            org_data['ogrn'] = value
-                        elif label == 'Дата регистрации':
-                            # Convert to datetime
-                            try:
-                                from datetime import datetime
-                                # Parse Russian date format
-                                months = {
-                                    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-                                    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-                                    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
-                                }
-                                parts = value.split()
-                                if len(parts) >= 3:
-                                    day = int(parts[0])
-                                    month = months.get(parts[1], 1)
-                                    year = int(parts[2].rstrip('г.'))
-                                    org_data['registration_date'] = datetime(year, month, day)
-                            except:
-                                pass
-                        elif label == 'Основной вид деятельности':
-                            # Extract OKVED code
-                            if ' ' in value:
-                                org_data['okved'] = value.split()[0]
-                            else:
-                                org_data['okved'] = value
-                        elif label == 'Директор' or label == 'Генеральный директор':
-                            org_data['director'] = value
-                        elif label == 'Уставный капитал':
-                            org_data['capital'] = value
+            for dl in _CARD_INFO_ROWS(company_item):
+                dt = _first(_ROW_TERM, dl)
+                dd = _first(_ROW_DEFINITION, dl)
+                if dt is not None and dd is not None:
+                    handler = _SEARCH_CARD_FIELDS.get(_text(dt))
+                    if handler:
+                        handler(_text(dd), org_data)
             
             # Extract address
-            address_elem = company_item.find('address', class_='company-item__text')
-            if address_elem:
-                org_data['address'] = address_elem.text.strip()
+            address_elem = _first(_CARD_ADDRESS, company_item)
+            if address_elem is not None:
+                org_data['address'] = _text(address_elem)
             
             # Set status as active (since we filter for active companies)
             org_data['status'] = 'Действующая'
             
-            return Organization(**org_data) if org_data else None
+            # Cards without a title can't form a valid Organization; skip validation
+            # and let the caller fall back to the company page
+            if 'name' not in org_data:
+                return None
+            
+            return Organization.model_construct(_fields_set=set(org_data), **org_data)
             
         except Exception as e:
             logger.error(f"Error parsing search result: {str(e)}")
@@ -228,39 +725,30 @@ class RusprofileScraperImpl(BaseHttpScraper):
 
 class ListOrgDataTransformer(OrganizationDataTransformer):
     
-    def transform(self, soup: BeautifulSoup) -> Optional[Organization]:
+    def transform(self, html: bytes) -> Optional[Organization]:
         try:
+            doc = _parse_html(html)
             org_data = {}
             
             # Extract title
-            title = soup.find('h1')
-            if title:
-                org_data['name'] = title.text.strip()
+            title = _first(_LISTORG_TITLE, doc)
+            if title is not None:
+                org_data['name'] = _text(title)
             
             # Extract data from table
-            info_table = soup.find('table', class_='table')
-            if info_table:
-                rows = info_table.find_all('tr')
+            info_table = _first(_LISTORG_TABLE, doc)
+            if info_table is not None:
+                rows = _LISTORG_ROWS(info_table)
                 for row in rows:
-                    cells = row.find_all('td')
+                    cells = _LISTORG_CELLS(row)
                     if len(cells) >= 2:
-                        label = cells[0].text.strip().lower()
-                        value = cells[1].text.strip()
-                        
-                        if 'инн' in label:
-                            org_data['inn'] = value
-                        elif 'огрн' in label:
-                            org_data['ogrn'] = value
-                        elif 'кпп' in label:
-                            org_data['kpp'] = value
-                        elif 'адрес' in label:
-                            org_data['address'] = value
-                        elif 'телефон' in label:
-                            org_data['phone'] = value
-                        elif 'оквэд' in label and 'okved' not in org_data:
-                            org_data['okved'] = value.split()[0] if value else None
-            
-            return Organization(**org_data) if org_data else None
+                        label = _text(cells[0]).lower()
+                        for keyword, handler in _LISTORG_FIELDS:
+                            if keyword in label:
+                                handler(_text(cells[1]), org_data)
+                                break
+            
+            return Organization.model_construct(_fields_set=set(org_data), **org_data) if 'name' in org_data else None
             
         except Exception as e:
             logger.error(f"Error transforming List-org data: {str(e)}")
@@ -269,53 +757,69 @@ class ListOrgDataTransformer(OrganizationDataTransformer):
 
 class ListOrgScraperImpl(BaseHttpScraper):
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, response_cache: Optional[FileResponseCache] = None):
+        super().__init__(response_cache)
         self.base_url = "https://www.list-org.com"
+        self.search_url = f"{self.base_url}/search"
         self.transformer = ListOrgDataTransformer()
     
     def get_scraper_name(self) -> str:
         return "ListOrgScraper"
     
-    def search_organization(self, name: str, region: str = "Тюменская область") -> Optional[Organization]:
+    def _get_search_params(self, name: str) -> Dict[str, str]:
+        return {
+            'val': name,
+            'type': 'all'
+        }
+    
+    def search_organization(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
         try:
-            search_url = f"{self.base_url}/search"
-            params = {
-                'val': name,
-                'type': 'all'
-            }
-            
-            response = self._make_request(search_url, params)
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Find results
-            results = soup.find_all('p', class_='org_list')
-            
-            for result in results:
-                # Check region
-                if region.lower() not in result.text.lower():
-                    continue
-                
-                link = result.find('a')
-                if link:
-                    company_url = self.base_url + link.get('href', '')
-                    return self._parse_company_page(company_url)
-            
-            return None
+            html = self._fetch(self.search_url, self._get_search_params(name))
+            company_url = self._find_company_url(html, region)
+            return self._fetch_and_transform(company_url, self.transformer) if company_url else None
             
         except Exception as e:
             logger.error(f"Error searching {name} on List-org: {str(e)}")
             return None
     
-    def _parse_company_page(self, url: str) -> Optional[Organization]:
+    async def search_organization_async(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        session: Optional[aiohttp.ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        if session is None:
+            return await super().search_organization_async(name, region, okved_prefixes=okved_prefixes)
+        
         try:
-            time.sleep(1)  # Rate limiting
-            response = self._make_request(url)
-            soup = BeautifulSoup(response.text, 'lxml')
-            return self.transformer.transform(soup)
+            html = await self._fetch_async(session, self.search_url, self._get_search_params(name))
+            company_url = self._find_company_url(html, region)
+            return await self._fetch_and_transform_async(session, company_url, self.transformer) if company_url else None
+            
         except Exception as e:
-            logger.error(f"Error parsing company page {url}: {str(e)}")
+            logger.error(f"Error searching {name} on List-org: {str(e)}")
             return None
+    
+    def _find_company_url(self, html: bytes, region: str) -> Optional[str]:
+        region_lc = region.lower()
+        # Results are inspected while the page is parsed; parsing stops at the first match
+        for result in _iter_elements_with_class(html, 'p', _CLASS_ORG_LIST):
+            # Check region; the address is plain text next to the link, so read the whole entry
+            if region_lc not in ''.join(result.itertext()).lower():
+                result.clear()
+                continue
+            
+            link = _first(_ANY_LINK, result)
+            if link is not None:
+                return self.base_url + link.get('href', '')
+        
+        return None
 
 
 class ZachemINNDataTransformer(OrganizationDataTransformer):
@@ -334,11 +838,9 @@ class ZachemINNDataTransformer(OrganizationDataTransformer):
             }
             
             # Parse registration date
-            if 'registration_date' in data:
-                try:
-                    org_data['registration_date'] = datetime.fromisoformat(data['registration_date'])
-                except:
-                    pass
+            registration_date = _parse_api_date(data.get('registration_date'))
+            if registration_date:
+                org_data['registration_date'] = registration_date
             
             return Organization(**org_data)
             
@@ -349,9 +851,10 @@ class ZachemINNDataTransformer(OrganizationDataTransformer):
 
 class ZachemINNScraperImpl(BaseHttpScraper):
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, response_cache: Optional[FileResponseCache] = None):
+        super().__init__(response_cache)
         self.base_url = "https://zachestnyibiznes.ru"
+        self.search_url = f"{self.base_url}/search"
         self.transformer = ZachemINNDataTransformer()
     
     def get_scraper_name(self) -> str:
@@ -365,25 +868,68 @@ class ZachemINNScraperImpl(BaseHttpScraper):
         })
         return headers
     
-    def search_organization(self, name: str, region: str = "Тюменская область") -> Optional[Organization]:
+    def _get_search_params(self, name: str) -> Dict[str, str]:
+        return {
+            'query': name,
+            'page': '1'
+        }
+    
+    def search_organization(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
         try:
-            search_url = f"{self.base_url}/search"
-            params = {
-                'query': name,
-                'page': 1
-            }
-            
-            response = self._make_request(search_url, params)
-            data = response.json() if response.text else {}
-            
-            if 'data' in data and isinstance(data['data'], list):
-                for item in data['data']:
-                    # Check region
-                    if 'address' in item and region.lower() in item.get('address', '').lower():
-                        return self.transformer.transform(item)
+            body = self._fetch(self.search_url, self._get_search_params(name))
+            data = orjson.loads(body) if body else {}
+            return self._find_in_response(data, region, okved_prefixes)
             
+        except Exception as e:
+            logger.error(f"Error searching {name} on ZachemINN: {str(e)}")
             return None
+    
+    async def search_organization_async(
+        self,
+        name: str,
+        region: str = "Тюменская область",
+        session: Optional[aiohttp.ClientSession] = None,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        if session is None:
+            return await super().search_organization_async(name, region, okved_prefixes=okved_prefixes)
+        
+        try:
+            body = await self._fetch_async(session, self.search_url, self._get_search_params(name))
+            data = orjson.loads(body) if body else {}
+            return self._find_in_response(data, region, okved_prefixes)
             
         except Exception as e:
             logger.error(f"Error searching {name} on ZachemINN: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _find_in_response(
+        self,
+        data: Dict,
+        region: str,
+        okved_prefixes: Tuple[str, ...] = ()
+    ) -> Optional[Organization]:
+        items = data.get('data')
+        if not isinstance(items, list):
+            return None
+        
+        region_lc = region.lower()
+        for item in items:
+            # Check region
+            address = item.get('address')
+            if not address or region_lc not in address.lower():
+                continue
+            
+            # Skip items whose OKVED doesn't match
+            okved = item.get('okved_code')
+            if okved_prefixes and okved and not okved.startswith(okved_prefixes):
+                continue
+            
+            return self.transformer.transform(item)
+        
+        return None
\ No newline at end of file
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """Task shared by concurrent callers, with the number of callers still awaiting it"""
+    
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one task per key, shared by every concurrent caller asking for that key"""
+    
+    def __init__(self):
+        # Keyed by event loop too, since a task can only be awaited from the loop running it
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Call] = {}
+    
+    def __len__(self) -> int:
+        return len(self._calls)
+    
+    async def do(self, key: Hashable, make_call: Callable[[], Awaitable[T]]) -> T:
+        """Await the call in flight for key, starting make_call() when there is none"""
+        call_key = (asyncio.get_running_loop(), key)
+        call = self._calls.get(call_key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(make_call()))
+            self._calls[call_key] = call
+            call.task.add_done_callback(lambda _: self._forget(call_key, call))
+        
+        call.waiters += 1
+        try:
+            # Every caller is shielded, so a cancelled one leaves the task running for the rest
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # The last caller is gone and nobody needs the result
+                call.task.cancel()
+                self._forget(call_key, call)
+    
+    def _forget(self, call_key: Tuple[asyncio.AbstractEventLoop, Hashable], call: _Call) -> None:
+        # A newer call for the key may have started after this one was cancelled
+        if self._calls.get(call_key) is call:
+            del self._calls[call_key]
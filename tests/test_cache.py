@@ -0,0 +1,36 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from src.cache import FileCacheStrategy
+
+
+class FileCacheStrategyTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+    
+    def test_legacy_file_is_still_read(self):
+        (self.cache_dir / 'ООО Ромашка.json').write_bytes(orjson.dumps({
+            'cached_at': time.time(),
+            'query': 'ООО "Ромашка"',
+            'organization': {'name': 'ООО "Ромашка"', 'okved': '86.23'}
+        }))
+        cache = FileCacheStrategy(str(self.cache_dir))
+        
+        self.assertEqual(cache.get('ООО "Ромашка"').okved, '86.23')
+    
+    def test_miss_probes_one_file(self):
+        cache = FileCacheStrategy(str(self.cache_dir))
+        with mock.patch.object(Path, 'read_bytes', autospec=True, side_effect=FileNotFoundError) as read_bytes:
+            self.assertIsNone(cache.get('ООО "Ромашка"'))
+        
+        self.assertEqual(read_bytes.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
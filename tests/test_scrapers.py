@@ -0,0 +1,17 @@
+import unittest
+
+from src.scrapers.scraper_implementations import _to_utf8
+
+
+class ToUtf8Test(unittest.TestCase):
+    
+    def test_declared_charset_is_transcoded(self):
+        self.assertEqual(_to_utf8('Ромашка'.encode('cp1251'), 'windows-1251'), 'Ромашка'.encode('utf-8'))
+    
+    def test_unknown_charset_falls_back_to_utf8(self):
+        self.assertEqual(_to_utf8('Ромашка'.encode('utf-8'), 'utf8mb4'), 'Ромашка'.encode('utf-8'))
+        self.assertEqual(_to_utf8(b'\xff ok', 'utf8mb4'), '� ok'.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+from src.cache import NoCacheStrategy
+from src.core.service import OrganizationSearchService
+from src.interfaces import OrganizationScraper
+from src.models import Organization
+
+
+class _LegacyScraper(OrganizationScraper):
+    """Scraper written against the interface before okved_prefixes existed"""
+    
+    def search_organization(self, name, region="Тюменская область"):
+        return Organization(name=name, okved='86.23')
+    
+    def get_scraper_name(self) -> str:
+        return "LegacyScraper"
+
+
+class DedupSearchTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def test_spelling_variants_share_one_search(self):
+        service = OrganizationSearchService(scrapers=[], cache_strategy=NoCacheStrategy())
+        searched = []
+        
+        async def search_single_async(session, name, region="Тюменская область"):
+            searched.append(name)
+            await asyncio.sleep(0)
+            return Organization(name=name)
+        
+        service.search_single_async = search_single_async
+        results = await asyncio.gather(
+            service._dedup_search(None, 'ООО «Ромашка»', 'Тюменская область'),
+            service._dedup_search(None, ' ооо  "Ромашка"', 'Тюменская область')
+        )
+        
+        self.assertEqual(searched, ['ООО «Ромашка»'])
+        self.assertEqual([org.name for org in results], ['ООО «Ромашка»'] * 2)
+
+
+
+class LegacyScraperTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.service = OrganizationSearchService(
+            scrapers=[_LegacyScraper()], cache_strategy=NoCacheStrategy(), okved_filters=['86']
+        )
+    
+    def test_single_search_calls_scraper_without_okved_prefixes(self):
+        self.assertEqual(self.service.search_single('ООО Ромашка').name, 'ООО Ромашка')
+    
+    def test_batch_search_calls_scraper_without_okved_prefixes(self):
+        results = self.service.search_multiple(['ООО Ромашка'])
+        self.assertEqual([org.name for org in results], ['ООО Ромашка'])
+
+
+
+class ConstructorTest(unittest.TestCase):
+    
+    def test_max_workers_is_accepted_but_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            service = OrganizationSearchService(scrapers=[], cache_strategy=NoCacheStrategy(), max_workers=3)
+        self.assertEqual(service.max_connections, 64)
+    
+    def test_positional_arguments_keep_their_meaning(self):
+        service = OrganizationSearchService([], NoCacheStrategy(), None, ['86.23'])
+        self.assertEqual(service.okved_filters, ['86.23'])
+        self.assertEqual(service.max_connections, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+
+from src.utils import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+        self.cancelled = False
+    
+    async def call(self) -> str:
+        self.calls += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return 'result'
+    
+    async def test_concurrent_callers_share_one_call(self):
+        results = await asyncio.gather(*(self.flight.do('key', self.call) for _ in range(3)))
+        
+        self.assertEqual(results, ['result'] * 3)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(self.flight), 0)
+    
+    async def test_cancelled_caller_does_not_cancel_other_waiters(self):
+        first = asyncio.create_task(self.flight.do('key', self.call))
+        second = asyncio.create_task(self.flight.do('key', self.call))
+        await asyncio.sleep(0)
+        
+        first.cancel()
+        
+        self.assertEqual(await second, 'result')
+        self.assertTrue(first.cancelled())
+        self.assertFalse(self.cancelled)
+        self.assertEqual(self.calls, 1)
+    
+    async def test_call_is_cancelled_once_no_caller_waits(self):
+        caller = asyncio.create_task(self.flight.do('key', self.call))
+        await asyncio.sleep(0)
+        
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        
+        self.assertTrue(self.cancelled)
+        self.assertEqual(len(self.flight), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()